@@ -0,0 +1,14 @@
+from google.cloud import bigquery
+from cache import ttl_cache
+
+# One client for the whole API process. Every bigquery.Client() resolves its
+# own credentials and opens its own HTTP session, so the routers share this.
+client = bigquery.Client()
+
+@ttl_cache()
+def fetch_rows(query):
+    """
+    Run a parameter-free query and return its rows as a list.
+    Results are cached per query text for cache.DEFAULT_TTL_SECONDS.
+    """
+    return list(client.query(query).result())
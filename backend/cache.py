@@ -0,0 +1,36 @@
+import functools
+import threading
+import time
+
+# Snapshot tables are only rewritten once a day by the Cloud Run jobs, so a
+# few minutes of staleness is invisible to the dashboards.
+DEFAULT_TTL_SECONDS = 300
+
+def ttl_cache(ttl_seconds=DEFAULT_TTL_SECONDS):
+    """
+    Memoize a function's return value per argument tuple for ttl_seconds.
+    Used to stop repeated dashboard loads re-running identical BigQuery queries.
+    Cached values are shared between callers and must not be mutated.
+    """
+    def decorator(func):
+        entries = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and entry[0] > now:
+                    return entry[1]
+
+            value = func(*args, **kwargs)
+            with lock:
+                entries[key] = (now + ttl_seconds, value)
+            return value
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from bq_client import client
 from routers import revenue, addons, health_insurance, customers, geography, requisitions
 import logging
 
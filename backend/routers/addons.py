@@ -1,11 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
-from google.cloud import bigquery
 from auth import verify_api_key
+from bq_client import fetch_rows
 from datetime import datetime
 import logging
 
 router = APIRouter()
-client = bigquery.Client()
 logger = logging.getLogger(__name__)
 
 @router.get("/latest")
@@ -22,8 +21,7 @@ async def addons_latest(api_key: str = Depends(verify_api_key)):
                 FROM `outstaffer-app-prod.dashboard_metrics.plan_addon_adoption`
             )
         """
-        query_job = client.query(query)
-        results = query_job.result()
+        results = fetch_rows(query)
 
         # Convert to list of dicts
         result_list = []
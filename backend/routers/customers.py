@@ -1,14 +1,54 @@
 # backend/routers/customers.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from google.cloud import bigquery
 from auth import verify_api_key
+from bq_client import client, fetch_rows
 from datetime import datetime
 import logging
 
 router = APIRouter()
-client = bigquery.Client()
 logger = logging.getLogger(__name__)
 
+# Shared by every latest-snapshot endpoint below. Keeping the query text
+# identical lets BigQuery answer repeat calls from its result cache instead
+# of rescanning customer_snapshot once per endpoint, and fetch_rows' TTL
+# cache skips the round trip entirely for a dashboard load.
+LATEST_SNAPSHOT_QUERY = """
+    SELECT *
+    FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
+    WHERE snapshot_date = (
+        SELECT MAX(snapshot_date)
+        FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
+    )
+"""
+
+
+def _fetch_latest_snapshot():
+    """Run the shared latest-snapshot query and return the rows as dicts."""
+    results = fetch_rows(LATEST_SNAPSHOT_QUERY)
+
+    # Convert to list of dicts
+    result_list = []
+    for row in results:
+        row_dict = dict(row)
+        # Convert date objects to ISO format
+        for key, value in row_dict.items():
+            if isinstance(value, datetime):
+                row_dict[key] = value.isoformat()
+        result_list.append(row_dict)
+
+    return result_list
+
+
+def _select_ranked(rows, metric_types, limit=None):
+    """
+    Filter snapshot rows to the given metric types, ordered by rank.
+    Matches BigQuery's ORDER BY rank ASC, which puts NULL ranks first.
+    """
+    selected = [row for row in rows if row["metric_type"] in metric_types]
+    selected.sort(key=lambda row: (row["rank"] is not None, row["rank"] or 0))
+    return selected[:limit] if limit is not None else selected
+
 @router.get("/latest")
 async def customers_latest(api_key: str = Depends(verify_api_key)):
     """
@@ -16,66 +56,21 @@ async def customers_latest(api_key: str = Depends(verify_api_key)):
     Returns all metrics from the most recent snapshot date.
     """
     try:
-        query = """
-            SELECT * 
-            FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
-            WHERE snapshot_date = (
-                SELECT MAX(snapshot_date) 
-                FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
-            )
-        """
-        query_job = client.query(query)
-        results = query_job.result()
-
-        # Convert to list of dicts
-        result_list = []
-        for row in results:
-            row_dict = dict(row)
-            # Convert date objects to ISO format
-            for key, value in row_dict.items():
-                if isinstance(value, datetime):
-                    row_dict[key] = value.isoformat()
-            result_list.append(row_dict)
-
-        return result_list
+        return _fetch_latest_snapshot()
 
     except Exception as e:
         logger.error(f"Error fetching latest customer metrics: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.get("/top-customers")
-async def top_customers(limit: int = 10, api_key: str = Depends(verify_api_key)):
+async def top_customers(limit: int = Query(10, ge=0), api_key: str = Depends(verify_api_key)):
     """
     Get the top customers by ARR.
     Returns top N customers ranked by ARR from the most recent snapshot.
     """
     try:
-        query = f"""
-            SELECT * 
-            FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
-            WHERE 
-                snapshot_date = (
-                    SELECT MAX(snapshot_date) 
-                    FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
-                )
-                AND metric_type = 'top_customer_by_arr'
-            ORDER BY rank ASC
-            LIMIT {limit}
-        """
-        query_job = client.query(query)
-        results = query_job.result()
-
-        # Convert to list of dicts
-        result_list = []
-        for row in results:
-            row_dict = dict(row)
-            # Convert date objects to ISO format
-            for key, value in row_dict.items():
-                if isinstance(value, datetime):
-                    row_dict[key] = value.isoformat()
-            result_list.append(row_dict)
-
-        return result_list
+        rows = _fetch_latest_snapshot()
+        return _select_ranked(rows, {"top_customer_by_arr"}, limit)
 
     except Exception as e:
         logger.error(f"Error fetching top customers: {str(e)}")
@@ -89,14 +84,16 @@ async def customer_trend(months: int = 6, api_key: str = Depends(verify_api_key)
     """
     try:
         query = """
-            WITH RankedSnapshots AS (
-                SELECT 
-                    snapshot_date,
-                    count as value,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY EXTRACT(YEAR FROM snapshot_date), EXTRACT(MONTH FROM snapshot_date) 
-                        ORDER BY snapshot_date DESC
-                    ) as rn
+            -- Last snapshot of each month
+            SELECT 
+                latest.snapshot_date,
+                latest.value 
+            FROM (
+                SELECT
+                    ARRAY_AGG(
+                        STRUCT(snapshot_date, count as value)
+                        ORDER BY snapshot_date DESC LIMIT 1
+                    )[OFFSET(0)] as latest
                 FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
                 WHERE 
                     snapshot_date >= DATE_SUB(
@@ -104,14 +101,9 @@ async def customer_trend(months: int = 6, api_key: str = Depends(verify_api_key)
                         INTERVAL @months MONTH
                     )
                     AND metric_type = 'active_customers'
+                GROUP BY DATE_TRUNC(snapshot_date, MONTH)
             )
-            
-            SELECT 
-                snapshot_date,
-                value 
-            FROM RankedSnapshots
-            WHERE rn = 1
-            ORDER BY snapshot_date
+            ORDER BY latest.snapshot_date
         """
 
         job_config = bigquery.QueryJobConfig(
@@ -146,111 +138,40 @@ async def company_sizes(api_key: str = Depends(verify_api_key)):
     Returns size distribution data from the most recent snapshot.
     """
     try:
-        query = """
-            SELECT * 
-            FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
-            WHERE 
-                snapshot_date = (
-                    SELECT MAX(snapshot_date) 
-                    FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
-                )
-                AND metric_type IN (
-                    'company_size_distribution', 
-                    'company_size_arr', 
-                    'company_size_avg_arr'
-                )
-            ORDER BY rank ASC
-        """
-        query_job = client.query(query)
-        results = query_job.result()
-
-        # Convert to list of dicts
-        result_list = []
-        for row in results:
-            row_dict = dict(row)
-            # Convert date objects to ISO format
-            for key, value in row_dict.items():
-                if isinstance(value, datetime):
-                    row_dict[key] = value.isoformat()
-            result_list.append(row_dict)
-
-        return result_list
+        rows = _fetch_latest_snapshot()
+        return _select_ranked(rows, {
+            "company_size_distribution",
+            "company_size_arr",
+            "company_size_avg_arr",
+        })
 
     except Exception as e:
         logger.error(f"Error fetching company size metrics: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.get("/industries-by-count")
-async def industries_by_count(limit: int = 10, api_key: str = Depends(verify_api_key)):
+async def industries_by_count(limit: int = Query(10, ge=0), api_key: str = Depends(verify_api_key)):
     """
     Get top industries by customer count.
     Returns industries ranked by number of customers from the most recent snapshot.
     """
     try:
-        query = f"""
-            SELECT * 
-            FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
-            WHERE 
-                snapshot_date = (
-                    SELECT MAX(snapshot_date) 
-                    FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
-                )
-                AND metric_type = 'top_industry_by_count'
-            ORDER BY rank ASC
-            LIMIT {limit}
-        """
-        query_job = client.query(query)
-        results = query_job.result()
-
-        # Convert to list of dicts
-        result_list = []
-        for row in results:
-            row_dict = dict(row)
-            # Convert date objects to ISO format
-            for key, value in row_dict.items():
-                if isinstance(value, datetime):
-                    row_dict[key] = value.isoformat()
-            result_list.append(row_dict)
-
-        return result_list
+        rows = _fetch_latest_snapshot()
+        return _select_ranked(rows, {"top_industry_by_count"}, limit)
 
     except Exception as e:
         logger.error(f"Error fetching industries by count: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.get("/industries-by-arr")
-async def industries_by_arr(limit: int = 10, api_key: str = Depends(verify_api_key)):
+async def industries_by_arr(limit: int = Query(10, ge=0), api_key: str = Depends(verify_api_key)):
     """
     Get top industries by ARR.
     Returns industries ranked by annual recurring revenue from the most recent snapshot.
     """
     try:
-        query = f"""
-            SELECT * 
-            FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
-            WHERE 
-                snapshot_date = (
-                    SELECT MAX(snapshot_date) 
-                    FROM `outstaffer-app-prod.dashboard_metrics.customer_snapshot`
-                )
-                AND metric_type = 'top_industry_by_arr'
-            ORDER BY rank ASC
-            LIMIT {limit}
-        """
-        query_job = client.query(query)
-        results = query_job.result()
-
-        # Convert to list of dicts
-        result_list = []
-        for row in results:
-            row_dict = dict(row)
-            # Convert date objects to ISO format
-            for key, value in row_dict.items():
-                if isinstance(value, datetime):
-                    row_dict[key] = value.isoformat()
-            result_list.append(row_dict)
-
-        return result_list
+        rows = _fetch_latest_snapshot()
+        return _select_ranked(rows, {"top_industry_by_arr"}, limit)
 
     except Exception as e:
         logger.error(f"Error fetching industries by ARR: {str(e)}")
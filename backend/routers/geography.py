@@ -2,11 +2,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from google.cloud import bigquery
 from auth import verify_api_key
+from bq_client import client, fetch_rows
 from datetime import datetime
 import logging
 
 router = APIRouter()
-client = bigquery.Client()
 logger = logging.getLogger(__name__)
 
 @router.get("/countries")
@@ -25,8 +25,7 @@ async def get_countries(api_key: str = Depends(verify_api_key)):
             )
             ORDER BY id, metric_type
         """
-        query_job = client.query(query)
-        results = query_job.result()
+        results = fetch_rows(query)
 
         # Get the latest snapshot date
         snapshot_date = None
@@ -134,48 +133,22 @@ async def get_geographic_trend(months: int = 6, api_key: str = Depends(verify_ap
     """
     try:
         query = """
-            WITH monthly_snapshots AS (
-                SELECT DISTINCT snapshot_date
-                FROM `outstaffer-app-prod.dashboard_metrics.geographic_metrics`
-                WHERE snapshot_date >= DATE_SUB(
+            SELECT
+                snapshot_date,
+                id AS country_code,
+                MAX(IF(metric_type = 'active_contracts_by_country', label, NULL)) AS country_name,
+                MAX(IF(metric_type = 'active_contracts_by_country', CAST(count AS INT64), NULL)) AS active_count,
+                MAX(IF(metric_type = 'mrr_by_country', CAST(value_aud AS FLOAT64), NULL)) AS mrr_value
+            FROM `outstaffer-app-prod.dashboard_metrics.geographic_metrics`
+            WHERE snapshot_date >= DATE_SUB(
                     (SELECT MAX(snapshot_date) FROM `outstaffer-app-prod.dashboard_metrics.geographic_metrics`),
                     INTERVAL @months MONTH
                 )
-                ORDER BY snapshot_date DESC
-            ),
-            
-            active_metrics AS (
-                SELECT 
-                    gm.snapshot_date,
-                    gm.id AS country_code,
-                    gm.label AS country_name,
-                    CAST(gm.count AS INT64) AS active_count
-                FROM `outstaffer-app-prod.dashboard_metrics.geographic_metrics` gm
-                JOIN monthly_snapshots ms ON gm.snapshot_date = ms.snapshot_date
-                WHERE gm.metric_type = 'active_contracts_by_country'
-            ),
-            
-            mrr_metrics AS (
-                SELECT 
-                    gm.snapshot_date,
-                    gm.id AS country_code,
-                    CAST(gm.value_aud AS FLOAT64) AS mrr_value
-                FROM `outstaffer-app-prod.dashboard_metrics.geographic_metrics` gm
-                JOIN monthly_snapshots ms ON gm.snapshot_date = ms.snapshot_date
-                WHERE gm.metric_type = 'mrr_by_country'
-            )
-            
-            SELECT
-                am.snapshot_date,
-                am.country_code,
-                am.country_name,
-                am.active_count,
-                mm.mrr_value
-            FROM active_metrics am
-            LEFT JOIN mrr_metrics mm
-                ON am.snapshot_date = mm.snapshot_date
-                AND am.country_code = mm.country_code
-            ORDER BY am.snapshot_date DESC, am.active_count DESC
+                AND metric_type IN ('active_contracts_by_country', 'mrr_by_country')
+            GROUP BY snapshot_date, country_code
+            -- Countries only appear in the trend once they have an active-count row
+            HAVING COUNTIF(metric_type = 'active_contracts_by_country') > 0
+            ORDER BY snapshot_date DESC, active_count DESC
         """
 
         job_config = bigquery.QueryJobConfig(
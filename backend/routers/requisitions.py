@@ -2,11 +2,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from google.cloud import bigquery
 from auth import verify_api_key
+from bq_client import client, fetch_rows
 import logging
 from datetime import datetime
 
 router = APIRouter()
-client = bigquery.Client()
 logger = logging.getLogger(__name__)
 
 @router.get("/latest")
@@ -22,8 +22,7 @@ async def requisitions_latest(api_key: str = Depends(verify_api_key)):
             )
             ORDER BY id, metric_type
         """
-        query_job = client.query(query)
-        results = query_job.result()
+        results = fetch_rows(query)
 
         snapshot_date = None
         countries = {}
@@ -115,16 +114,16 @@ async def requisition_trend(months: int = 6, api_key: str = Depends(verify_api_k
                 SUM(count) as total_positions
               FROM `outstaffer-app-prod.dashboard_metrics.requisition_snapshots`
               WHERE metric_type = 'approved_positions'
+                AND DATE_TRUNC(snapshot_date, MONTH) >= DATE_SUB(
+                  (SELECT MAX(snapshot_date) FROM `outstaffer-app-prod.dashboard_metrics.requisition_snapshots`),
+                  INTERVAL @months MONTH
+                )
               GROUP BY month_start
             )
             SELECT
               FORMAT_DATE('%Y-%m', month_start) AS snapshot_month,
               total_positions
             FROM monthly_data
-            WHERE month_start >= DATE_SUB(
-              (SELECT MAX(snapshot_date) FROM `outstaffer-app-prod.dashboard_metrics.requisition_snapshots`),
-              INTERVAL @months MONTH
-            )
             ORDER BY snapshot_month
         """
         job_config = bigquery.QueryJobConfig(query_parameters=[
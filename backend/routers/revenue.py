@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from google.cloud import bigquery
 from auth import verify_api_key
+from bq_client import client, fetch_rows
 import datetime
 import logging
 
 router = APIRouter()
-client = bigquery.Client()
 logger = logging.getLogger(__name__)
 
 @router.get("/latest")
@@ -19,8 +19,7 @@ async def revenue_latest(api_key: str = Depends(verify_api_key)):
                 FROM `outstaffer-app-prod.dashboard_metrics.monthly_revenue_metrics`
             )
         """
-        query_job = client.query(query)
-        results = query_job.result()
+        results = fetch_rows(query)
 
         rows = list(results)
         if not rows:
@@ -53,25 +52,23 @@ async def revenue_latest(api_key: str = Depends(verify_api_key)):
 async def revenue_trend(months: int = 6, api_key: str = Depends(verify_api_key)):
     try:
         query = """
-            WITH RankedSnapshots AS (
-                SELECT 
-                    snapshot_date,
-                    value_aud AS total_mrr,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY EXTRACT(YEAR FROM snapshot_date), EXTRACT(MONTH FROM snapshot_date)
-                        ORDER BY snapshot_date DESC
-                    ) AS rn
+            -- Last snapshot of each month
+            SELECT latest.snapshot_date, latest.total_mrr
+            FROM (
+                SELECT
+                    ARRAY_AGG(
+                        STRUCT(snapshot_date, value_aud AS total_mrr)
+                        ORDER BY snapshot_date DESC LIMIT 1
+                    )[OFFSET(0)] AS latest
                 FROM `outstaffer-app-prod.dashboard_metrics.monthly_revenue_metrics`
                 WHERE metric_type = 'total_summary' AND id = 'total_mrr'
                 AND snapshot_date >= DATE_SUB(
                     (SELECT MAX(snapshot_date) FROM `outstaffer-app-prod.dashboard_metrics.monthly_revenue_metrics`),
                     INTERVAL @months MONTH
                 )
+                GROUP BY DATE_TRUNC(snapshot_date, MONTH)
             )
-            SELECT snapshot_date, total_mrr
-            FROM RankedSnapshots
-            WHERE rn = 1
-            ORDER BY snapshot_date
+            ORDER BY latest.snapshot_date
         """
         job_config = bigquery.QueryJobConfig(
             query_parameters=[bigquery.ScalarQueryParameter("months", "INT64", months)]
@@ -97,25 +94,23 @@ async def revenue_trend(months: int = 6, api_key: str = Depends(verify_api_key))
 async def subscription_trend(months: int = 6, api_key: str = Depends(verify_api_key)):
     try:
         query = """
-            WITH RankedSnapshots AS (
-                SELECT 
-                    snapshot_date,
-                    count AS total_active_subscriptions,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY EXTRACT(YEAR FROM snapshot_date), EXTRACT(MONTH FROM snapshot_date)
-                        ORDER BY snapshot_date DESC
-                    ) AS rn
+            -- Last snapshot of each month
+            SELECT latest.snapshot_date, latest.total_active_subscriptions
+            FROM (
+                SELECT
+                    ARRAY_AGG(
+                        STRUCT(snapshot_date, count AS total_active_subscriptions)
+                        ORDER BY snapshot_date DESC LIMIT 1
+                    )[OFFSET(0)] AS latest
                 FROM `outstaffer-app-prod.dashboard_metrics.monthly_revenue_metrics`
                 WHERE metric_type = 'total_active_subscriptions' AND id = 'total_active'
                 AND snapshot_date >= DATE_SUB(
                     (SELECT MAX(snapshot_date) FROM `outstaffer-app-prod.dashboard_metrics.monthly_revenue_metrics`),
                     INTERVAL @months MONTH
                 )
+                GROUP BY DATE_TRUNC(snapshot_date, MONTH)
             )
-            SELECT snapshot_date, total_active_subscriptions
-            FROM RankedSnapshots
-            WHERE rn = 1
-            ORDER BY snapshot_date
+            ORDER BY latest.snapshot_date
         """
         job_config = bigquery.QueryJobConfig(
             query_parameters=[bigquery.ScalarQueryParameter("months", "INT64", months)]
@@ -31,6 +31,19 @@ SOURCE_VIEW   = f"{PROJECT_ID}.dashboard_views.vw_customer_snapshot"
 TARGET_TABLE  = f"{PROJECT_ID}.dashboard_metrics.customer_snapshot"
 UNMAPPED_VIEW = f"{PROJECT_ID}.dashboard_views.vw_unmapped_contract_statuses"
 
+# Columns read from SOURCE_VIEW, in target table order. Selecting them
+# explicitly (rather than SELECT *) keeps any extra view columns off the wire.
+# snapshot_date is added by prepare_for_bigquery.
+VIEW_COLUMNS = [
+    "metric_type",
+    "id",
+    "label",
+    "count",
+    "value_aud",
+    "percentage",
+    "rank",
+]
+
 # -----------------------------------------------------------------------------
 # Logging
 # -----------------------------------------------------------------------------
@@ -68,11 +81,16 @@ def warn_if_unmapped_statuses(client: bigquery.Client) -> None:
         logger.warning("Could not check unmapped statuses: %s", e)
 
 
-def fetch_metrics(client: bigquery.Client) -> pd.DataFrame:
-    """Query the customer snapshot view and return a dataframe."""
-    query = f"SELECT * FROM `{SOURCE_VIEW}`"
+def start_metrics_query(client: bigquery.Client) -> bigquery.QueryJob:
+    """Submit the customer snapshot view query without waiting for the results."""
+    query = f"SELECT {', '.join(VIEW_COLUMNS)} FROM `{SOURCE_VIEW}`"
     logger.info("Querying %s", SOURCE_VIEW)
-    df = client.query(query).result().to_dataframe()
+    return client.query(query)
+
+
+def fetch_metrics(job: bigquery.QueryJob) -> pd.DataFrame:
+    """Wait for the customer snapshot view query and return a dataframe."""
+    df = job.result().to_dataframe()
     logger.info("Fetched %d metric rows", len(df))
     return df
 
@@ -81,24 +99,11 @@ def prepare_for_bigquery(df: pd.DataFrame, snapshot_date) -> pd.DataFrame:
     """
     Add snapshot_date and coerce columns to match the customer_snapshot schema.
     The schema includes a 'rank' INT64 NULLABLE column (not in revenue schema).
+    Modifies df in place (callers pass the frame fresh from fetch_metrics).
     """
-    df = df.copy()
-    df["snapshot_date"] = snapshot_date
-
-    expected_columns = [
-        "snapshot_date",
-        "metric_type",
-        "id",
-        "label",
-        "count",
-        "value_aud",
-        "percentage",
-        "rank",
-    ]
-    df = df[expected_columns]
+    df.insert(0, "snapshot_date", snapshot_date)
 
     # Type coercion
-    df["snapshot_date"] = pd.to_datetime(df["snapshot_date"]).dt.date
     df["metric_type"]   = df["metric_type"].fillna("").astype(str)
     df["id"]            = df["id"].fillna("").astype(str)
     df["label"]         = df["label"].fillna("").astype(str)
@@ -147,11 +152,12 @@ def main() -> None:
 
     client = bigquery.Client(project=PROJECT_ID)
 
-    # 1. Data quality check
+    # 1. Start the view query, then run the data quality check while it executes
+    metrics_job = start_metrics_query(client)
     warn_if_unmapped_statuses(client)
 
     # 2. Fetch from view
-    metrics_df = fetch_metrics(client)
+    metrics_df = fetch_metrics(metrics_job)
     if metrics_df.empty:
         logger.error("No metrics returned from %s. Aborting.", SOURCE_VIEW)
         sys.exit(1)
@@ -160,10 +166,10 @@ def main() -> None:
     metrics_df = prepare_for_bigquery(metrics_df, snapshot_date)
 
     # 4. Log summary
-    summary = metrics_df.groupby("metric_type").size().reset_index(name="rows")
+    summary = metrics_df.groupby("metric_type").size()
     logger.info("Metric breakdown:")
-    for _, row in summary.iterrows():
-        logger.info("  - %s: %d rows", row["metric_type"], row["rows"])
+    for metric_type, row_count in summary.items():
+        logger.info("  - %s: %d rows", metric_type, row_count)
 
     # Headline numbers
     headlines = metrics_df[
@@ -172,13 +178,15 @@ def main() -> None:
             "avg_arr_per_customer", "TOP_10",
         ])
     ]
-    for _, row in headlines.iterrows():
-        if pd.notna(row["value_aud"]):
-            logger.info("  %s = AUD %.2f", row["id"], row["value_aud"])
-        elif pd.notna(row["count"]):
-            logger.info("  %s = %s", row["id"], row["count"])
-        elif pd.notna(row["percentage"]):
-            logger.info("  %s = %.1f%%", row["id"], row["percentage"])
+    for metric_id, value_aud, count, percentage in headlines[
+        ["id", "value_aud", "count", "percentage"]
+    ].itertuples(index=False, name=None):
+        if pd.notna(value_aud):
+            logger.info("  %s = AUD %.2f", metric_id, value_aud)
+        elif pd.notna(count):
+            logger.info("  %s = %s", metric_id, count)
+        elif pd.notna(percentage):
+            logger.info("  %s = %.1f%%", metric_id, percentage)
 
     # 5. Schema — matches existing customer_snapshot table
     schema = [
@@ -31,6 +31,18 @@ SOURCE_VIEW   = f"{PROJECT_ID}.dashboard_views.vw_geographic_snapshot"
 TARGET_TABLE  = f"{PROJECT_ID}.dashboard_metrics.geographic_metrics"
 UNMAPPED_VIEW = f"{PROJECT_ID}.dashboard_views.vw_unmapped_contract_statuses"
 
+# Columns read from SOURCE_VIEW, in target table order. Selecting them
+# explicitly (rather than SELECT *) keeps any extra view columns off the wire.
+# snapshot_date is added by prepare_for_bigquery.
+VIEW_COLUMNS = [
+    "metric_type",
+    "id",
+    "label",
+    "count",
+    "value_aud",
+    "percentage",
+]
+
 # -----------------------------------------------------------------------------
 # Logging
 # -----------------------------------------------------------------------------
@@ -68,11 +80,16 @@ def warn_if_unmapped_statuses(client: bigquery.Client) -> None:
         logger.warning("Could not check unmapped statuses: %s", e)
 
 
-def fetch_metrics(client: bigquery.Client) -> pd.DataFrame:
-    """Query the geographic snapshot view and return a dataframe."""
-    query = f"SELECT * FROM `{SOURCE_VIEW}`"
+def start_metrics_query(client: bigquery.Client) -> bigquery.QueryJob:
+    """Submit the geographic snapshot view query without waiting for the results."""
+    query = f"SELECT {', '.join(VIEW_COLUMNS)} FROM `{SOURCE_VIEW}`"
     logger.info("Querying %s", SOURCE_VIEW)
-    df = client.query(query).result().to_dataframe()
+    return client.query(query)
+
+
+def fetch_metrics(job: bigquery.QueryJob) -> pd.DataFrame:
+    """Wait for the geographic snapshot view query and return a dataframe."""
+    df = job.result().to_dataframe()
     logger.info("Fetched %d metric rows", len(df))
     return df
 
@@ -82,23 +99,11 @@ def prepare_for_bigquery(df: pd.DataFrame, snapshot_date) -> pd.DataFrame:
     Add snapshot_date and coerce columns to match the geographic_metrics schema.
     Schema matches revenue/customer: snapshot_date, metric_type, id, label,
     count, value_aud, percentage.
+    Modifies df in place (callers pass the frame fresh from fetch_metrics).
     """
-    df = df.copy()
-    df["snapshot_date"] = snapshot_date
-
-    expected_columns = [
-        "snapshot_date",
-        "metric_type",
-        "id",
-        "label",
-        "count",
-        "value_aud",
-        "percentage",
-    ]
-    df = df[expected_columns]
+    df.insert(0, "snapshot_date", snapshot_date)
 
     # Float for integer-nullable columns (NaN → empty CSV field → NULL in BQ)
-    df["snapshot_date"] = pd.to_datetime(df["snapshot_date"]).dt.date
     df["metric_type"]   = df["metric_type"].fillna("").astype(str)
     df["id"]            = df["id"].fillna("").astype(str)
     df["label"]         = df["label"].fillna("").astype(str)
@@ -130,11 +135,12 @@ def main() -> None:
 
     client = bigquery.Client(project=PROJECT_ID)
 
-    # 1. Data quality check
+    # 1. Start the view query, then run the data quality check while it executes
+    metrics_job = start_metrics_query(client)
     warn_if_unmapped_statuses(client)
 
     # 2. Fetch from view
-    metrics_df = fetch_metrics(client)
+    metrics_df = fetch_metrics(metrics_job)
     if metrics_df.empty:
         logger.error("No metrics returned from %s. Aborting.", SOURCE_VIEW)
         sys.exit(1)
@@ -143,23 +149,23 @@ def main() -> None:
     metrics_df = prepare_for_bigquery(metrics_df, snapshot_date)
 
     # 4. Log summary
-    summary = metrics_df.groupby("metric_type").size().reset_index(name="rows")
+    summary = metrics_df.groupby("metric_type").size()
     logger.info("Metric breakdown:")
-    for _, row in summary.iterrows():
-        logger.info("  - %s: %d rows", row["metric_type"], row["rows"])
+    for metric_type, row_count in summary.items():
+        logger.info("  - %s: %d rows", metric_type, row_count)
+
+    metric_types = metrics_df["metric_type"]
 
     # Top 3 countries by active contracts
-    top = (
-        metrics_df[metrics_df["metric_type"] == "active_contracts_by_country"]
-        .sort_values("count", ascending=False)
-        .head(3)
-    )
+    top = metrics_df.loc[
+        metric_types == "active_contracts_by_country", ["label", "id", "count"]
+    ].nlargest(3, "count")
     logger.info("Top countries by active contracts:")
-    for _, row in top.iterrows():
-        logger.info("  %s (%s): %d contracts", row["label"], row["id"], row["count"])
+    for label, country_id, count in top.itertuples(index=False, name=None):
+        logger.info("  %s (%s): %d contracts", label, country_id, count)
 
     # Total MRR across all countries
-    total_mrr = metrics_df[metrics_df["metric_type"] == "mrr_by_country"]["value_aud"].sum()
+    total_mrr = metrics_df.loc[metric_types == "mrr_by_country", "value_aud"].sum()
     logger.info("Total MRR (all countries): AUD %.2f", total_mrr)
 
     # 5. Schema — matches existing geographic_metrics table
@@ -31,6 +31,20 @@ SOURCE_VIEW   = f"{PROJECT_ID}.dashboard_views.vw_health_insurance_snapshot"
 TARGET_TABLE  = f"{PROJECT_ID}.dashboard_metrics.health_insurance_metrics"
 UNMAPPED_VIEW = f"{PROJECT_ID}.dashboard_views.vw_unmapped_contract_statuses"
 
+# Columns read from SOURCE_VIEW, in target table order. Selecting them
+# explicitly (rather than SELECT *) keeps any extra view columns off the wire.
+# snapshot_date is added by prepare_for_bigquery.
+VIEW_COLUMNS = [
+    "metric_type",
+    "id",
+    "label",
+    "count",
+    "overall_percentage",
+    "category_percentage",
+    "contract_count",
+    "is_multi_country",
+]
+
 # -----------------------------------------------------------------------------
 # Logging
 # -----------------------------------------------------------------------------
@@ -64,10 +78,14 @@ def warn_if_unmapped_statuses(client: bigquery.Client) -> None:
         logger.warning("Could not check unmapped statuses: %s", e)
 
 
-def fetch_metrics(client: bigquery.Client) -> pd.DataFrame:
-    query = f"SELECT * FROM `{SOURCE_VIEW}`"
+def start_metrics_query(client: bigquery.Client) -> bigquery.QueryJob:
+    query = f"SELECT {', '.join(VIEW_COLUMNS)} FROM `{SOURCE_VIEW}`"
     logger.info("Querying %s", SOURCE_VIEW)
-    df = client.query(query).result().to_dataframe()
+    return client.query(query)
+
+
+def fetch_metrics(job: bigquery.QueryJob) -> pd.DataFrame:
+    df = job.result().to_dataframe()
     logger.info("Fetched %d metric rows", len(df))
     return df
 
@@ -77,24 +95,10 @@ def prepare_for_bigquery(df: pd.DataFrame, snapshot_date) -> pd.DataFrame:
     Add snapshot_date and coerce columns to match the health_insurance_metrics schema.
     This table has overall_percentage, category_percentage, contract_count,
     and is_multi_country (BOOLEAN) in addition to the standard columns.
+    Modifies df in place (callers pass the frame fresh from fetch_metrics).
     """
-    df = df.copy()
-    df["snapshot_date"] = snapshot_date
+    df.insert(0, "snapshot_date", snapshot_date)
 
-    expected_columns = [
-        "snapshot_date",
-        "metric_type",
-        "id",
-        "label",
-        "count",
-        "overall_percentage",
-        "category_percentage",
-        "contract_count",
-        "is_multi_country",
-    ]
-    df = df[expected_columns]
-
-    df["snapshot_date"]       = pd.to_datetime(df["snapshot_date"]).dt.date
     df["metric_type"]         = df["metric_type"].fillna("").astype(str)
     df["id"]                  = df["id"].fillna("").astype(str)
     df["label"]               = df["label"].fillna("").astype(str)
@@ -132,11 +136,12 @@ def main() -> None:
 
     client = bigquery.Client(project=PROJECT_ID)
 
-    # 1. Data quality check
+    # 1. Start the view query, then run the data quality check while it executes
+    metrics_job = start_metrics_query(client)
     warn_if_unmapped_statuses(client)
 
     # 2. Fetch from view
-    metrics_df = fetch_metrics(client)
+    metrics_df = fetch_metrics(metrics_job)
     if metrics_df.empty:
         logger.error("No metrics returned from %s. Aborting.", SOURCE_VIEW)
         sys.exit(1)
@@ -145,25 +150,29 @@ def main() -> None:
     metrics_df = prepare_for_bigquery(metrics_df, snapshot_date)
 
     # 4. Log summary
-    summary = metrics_df.groupby("metric_type").size().reset_index(name="rows")
+    # One grouping by metric_type, reused for the breakdown and the totals below
+    by_type = metrics_df.groupby("metric_type")
+    summary = by_type.size()
     logger.info("Metric breakdown:")
-    for _, row in summary.iterrows():
-        logger.info("  - %s: %d rows", row["metric_type"], row["rows"])
+    for metric_type, row_count in summary.items():
+        logger.info("  - %s: %d rows", metric_type, row_count)
 
     # Overall coverage
-    eligible = metrics_df[metrics_df["metric_type"] == "eligible_contracts_by_country"]["count"].sum()
-    covered  = metrics_df[metrics_df["metric_type"] == "health_insurance_total_by_country"]["count"].sum()
-    deps     = metrics_df[metrics_df["metric_type"] == "health_insurance_dependents_by_country"]["count"].sum()
+    count_totals = by_type["count"].sum()
+    eligible = count_totals.get("eligible_contracts_by_country", 0)
+    covered  = count_totals.get("health_insurance_total_by_country", 0)
+    deps     = count_totals.get("health_insurance_dependents_by_country", 0)
     logger.info("  Eligible contracts:  %d", eligible)
     logger.info("  Covered contracts:   %d (%.1f%%)", covered,
                 (covered / eligible * 100) if eligible else 0)
     logger.info("  Total dependents:    %d", deps)
 
     # Multi-country plans
-    multi = metrics_df[
+    multi = metrics_df.loc[
         (metrics_df["metric_type"] == "health_insurance_plan_by_country") &
-        (metrics_df["is_multi_country"] == True)
-    ]["id"].nunique()
+        (metrics_df["is_multi_country"] == True),
+        "id",
+    ].nunique()
     logger.info("  Multi-country plans: %d", multi)
 
     # 5. Schema — matches existing health_insurance_metrics table
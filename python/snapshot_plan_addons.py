@@ -32,6 +32,19 @@ SOURCE_VIEW  = f"{PROJECT_ID}.dashboard_views.vw_plan_addon_snapshot"
 TARGET_TABLE = f"{PROJECT_ID}.dashboard_metrics.plan_addon_adoption"
 UNMAPPED_VIEW = f"{PROJECT_ID}.dashboard_views.vw_unmapped_contract_statuses"
 
+# Columns read from SOURCE_VIEW, in target table order. Selecting them
+# explicitly (rather than SELECT *) keeps any extra view columns off the wire.
+# snapshot_date is added by prepare_for_bigquery.
+VIEW_COLUMNS = [
+    "metric_type",
+    "id",
+    "label",
+    "count",
+    "overall_percentage",
+    "category_percentage",
+    "contract_count",
+]
+
 # -----------------------------------------------------------------------------
 # Logging
 # -----------------------------------------------------------------------------
@@ -69,11 +82,16 @@ def warn_if_unmapped_statuses(client: bigquery.Client) -> None:
         logger.warning("Could not check unmapped statuses: %s", e)
 
 
-def fetch_metrics(client: bigquery.Client) -> pd.DataFrame:
-    """Query the plan/addon snapshot view and return a dataframe."""
-    query = f"SELECT * FROM `{SOURCE_VIEW}`"
+def start_metrics_query(client: bigquery.Client) -> bigquery.QueryJob:
+    """Submit the plan/addon snapshot view query without waiting for the results."""
+    query = f"SELECT {', '.join(VIEW_COLUMNS)} FROM `{SOURCE_VIEW}`"
     logger.info("Querying %s", SOURCE_VIEW)
-    df = client.query(query).result().to_dataframe()
+    return client.query(query)
+
+
+def fetch_metrics(job: bigquery.QueryJob) -> pd.DataFrame:
+    """Wait for the plan/addon snapshot view query and return a dataframe."""
+    df = job.result().to_dataframe()
     logger.info("Fetched %d metric rows", len(df))
     return df
 
@@ -83,25 +101,12 @@ def prepare_for_bigquery(df: pd.DataFrame, snapshot_date) -> pd.DataFrame:
     Add snapshot_date and coerce columns to match the plan_addon_adoption schema.
     This table has overall_percentage, category_percentage, and contract_count
     in addition to the standard columns.
+    Modifies df in place (callers pass the frame fresh from fetch_metrics).
     """
-    df = df.copy()
-    df["snapshot_date"] = snapshot_date
-
-    expected_columns = [
-        "snapshot_date",
-        "metric_type",
-        "id",
-        "label",
-        "count",
-        "overall_percentage",
-        "category_percentage",
-        "contract_count",
-    ]
-    df = df[expected_columns]
+    df.insert(0, "snapshot_date", snapshot_date)
 
     # Type coercion — use float for integer columns so NaN serialises cleanly
     # to empty string in CSV (snapshot_utils writes via CSV load job)
-    df["snapshot_date"]        = pd.to_datetime(df["snapshot_date"]).dt.date
     df["metric_type"]          = df["metric_type"].fillna("").astype(str)
     df["id"]                   = df["id"].fillna("").astype(str)
     df["label"]                = df["label"].fillna("").astype(str)
@@ -134,11 +139,12 @@ def main() -> None:
 
     client = bigquery.Client(project=PROJECT_ID)
 
-    # 1. Data quality check
+    # 1. Start the view query, then run the data quality check while it executes
+    metrics_job = start_metrics_query(client)
     warn_if_unmapped_statuses(client)
 
     # 2. Fetch from view
-    metrics_df = fetch_metrics(client)
+    metrics_df = fetch_metrics(metrics_job)
     if metrics_df.empty:
         logger.error("No metrics returned from %s. Aborting.", SOURCE_VIEW)
         sys.exit(1)
@@ -147,20 +153,23 @@ def main() -> None:
     metrics_df = prepare_for_bigquery(metrics_df, snapshot_date)
 
     # 4. Log summary
-    summary = metrics_df.groupby("metric_type").size().reset_index(name="rows")
+    summary = metrics_df.groupby("metric_type").size()
     logger.info("Metric breakdown:")
-    for _, row in summary.iterrows():
-        logger.info("  - %s: %d rows", row["metric_type"], row["rows"])
+    for metric_type, row_count in summary.items():
+        logger.info("  - %s: %d rows", metric_type, row_count)
 
     # Headline numbers — top item per category
-    for metric_type in ["plan", "device", "os_choice", "country"]:
-        top = (
-            metrics_df[metrics_df["metric_type"] == metric_type]
-            .sort_values("contract_count", ascending=False)
-            .head(1)
-        )
-        if not top.empty:
-            r = top.iloc[0]
+    headline_types = ["plan", "device", "os_choice", "country"]
+    tops = (
+        metrics_df[metrics_df["metric_type"].isin(headline_types)]
+        .sort_values("contract_count", ascending=False)
+        .groupby("metric_type", sort=False)
+        .head(1)
+        .set_index("metric_type")
+    )
+    for metric_type in headline_types:
+        if metric_type in tops.index:
+            r = tops.loc[metric_type]
             logger.info(
                 "  Top %s: %s (%d contracts, %.1f%% overall)",
                 metric_type, r["label"], r["contract_count"], r["overall_percentage"],
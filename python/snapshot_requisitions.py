@@ -31,6 +31,18 @@ SOURCE_VIEW   = f"{PROJECT_ID}.dashboard_views.vw_requisition_snapshot"
 TARGET_TABLE  = f"{PROJECT_ID}.dashboard_metrics.requisition_snapshots"
 UNMAPPED_VIEW = f"{PROJECT_ID}.dashboard_views.vw_unmapped_contract_statuses"
 
+# Columns read from SOURCE_VIEW, in target table order. Selecting them
+# explicitly (rather than SELECT *) keeps any extra view columns off the wire.
+# snapshot_date is added by prepare_for_bigquery.
+VIEW_COLUMNS = [
+    "metric_type",
+    "id",
+    "label",
+    "count",
+    "value_aud",
+    "percentage",
+]
+
 # -----------------------------------------------------------------------------
 # Logging
 # -----------------------------------------------------------------------------
@@ -61,10 +73,14 @@ def warn_if_unmapped_statuses(client: bigquery.Client) -> None:
         logger.warning("Could not check unmapped statuses: %s", e)
 
 
-def fetch_metrics(client: bigquery.Client) -> pd.DataFrame:
-    query = f"SELECT * FROM `{SOURCE_VIEW}`"
+def start_metrics_query(client: bigquery.Client) -> bigquery.QueryJob:
+    query = f"SELECT {', '.join(VIEW_COLUMNS)} FROM `{SOURCE_VIEW}`"
     logger.info("Querying %s", SOURCE_VIEW)
-    df = client.query(query).result().to_dataframe()
+    return client.query(query)
+
+
+def fetch_metrics(job: bigquery.QueryJob) -> pd.DataFrame:
+    df = job.result().to_dataframe()
     logger.info("Fetched %d metric rows", len(df))
     return df
 
@@ -73,22 +89,10 @@ def prepare_for_bigquery(df: pd.DataFrame, snapshot_date) -> pd.DataFrame:
     """
     Add snapshot_date and coerce columns to match the requisition_snapshots schema.
     Standard schema: snapshot_date, metric_type, id, label, count, value_aud, percentage.
+    Modifies df in place (callers pass the frame fresh from fetch_metrics).
     """
-    df = df.copy()
-    df["snapshot_date"] = snapshot_date
-
-    expected_columns = [
-        "snapshot_date",
-        "metric_type",
-        "id",
-        "label",
-        "count",
-        "value_aud",
-        "percentage",
-    ]
-    df = df[expected_columns]
+    df.insert(0, "snapshot_date", snapshot_date)
 
-    df["snapshot_date"] = pd.to_datetime(df["snapshot_date"]).dt.date
     df["metric_type"]   = df["metric_type"].fillna("").astype(str)
     df["id"]            = df["id"].fillna("").astype(str)
     df["label"]         = df["label"].fillna("").astype(str)
@@ -121,11 +125,12 @@ def main() -> None:
 
     client = bigquery.Client(project=PROJECT_ID)
 
-    # 1. Data quality check
+    # 1. Start the view query, then run the data quality check while it executes
+    metrics_job = start_metrics_query(client)
     warn_if_unmapped_statuses(client)
 
     # 2. Fetch from view
-    metrics_df = fetch_metrics(client)
+    metrics_df = fetch_metrics(metrics_job)
     if metrics_df.empty:
         logger.error("No metrics returned from %s. Aborting.", SOURCE_VIEW)
         sys.exit(1)
@@ -134,17 +139,21 @@ def main() -> None:
     metrics_df = prepare_for_bigquery(metrics_df, snapshot_date)
 
     # 4. Log summary
-    summary = metrics_df.groupby("metric_type").size().reset_index(name="row_count")
+    # One grouping by metric_type, reused for the breakdown and the totals below
+    by_type = metrics_df.groupby("metric_type")
+    summary = by_type.size()
     logger.info("Metric breakdown:")
-    for _, row in summary.iterrows():
-        logger.info("  - %s: %d rows", row["metric_type"], row["row_count"])
+    for metric_type, row_count in summary.items():
+        logger.info("  - %s: %d rows", metric_type, row_count)
 
     # Headline numbers
+    totals = by_type[["count", "value_aud"]].sum()
+
     def get_total(metric):
-        return metrics_df[metrics_df["metric_type"] == metric]["count"].sum()
+        return totals["count"].get(metric, 0)
 
     def get_value(metric):
-        return metrics_df[metrics_df["metric_type"] == metric]["value_aud"].sum()
+        return totals["value_aud"].get(metric, 0.0)
 
     logger.info("  Total requisitions:   %d", get_total("total_requisitions"))
     logger.info("  Approved:             %d", get_total("approved_requisitions"))
@@ -155,9 +164,11 @@ def main() -> None:
     jsd = metrics_df[metrics_df["metric_type"] == "job_status_distribution"]
     if not jsd.empty:
         logger.info("  Job status distribution:")
-        for _, row in jsd.sort_values("count", ascending=False).iterrows():
-            logger.info("    %s: %d (%.1f%%)", row["id"], row["count"],
-                        row["percentage"] if pd.notna(row["percentage"]) else 0)
+        for status, count, percentage in jsd.sort_values("count", ascending=False)[
+            ["id", "count", "percentage"]
+        ].itertuples(index=False, name=None):
+            logger.info("    %s: %d (%.1f%%)", status, count,
+                        percentage if pd.notna(percentage) else 0)
 
     # 5. Schema — matches existing requisition_snapshots table
     schema = [
@@ -1,10 +1,10 @@
 # snapshot_utils.py
+import io
 import pandas as pd
 from google.cloud import bigquery
 import logging
 import sys
 from datetime import datetime
-import os
 
 # Update the write_snapshot_to_bigquery function in snapshot_utils.py
 # Updated write_snapshot_to_bigquery function in snapshot_utils.py
@@ -29,9 +29,9 @@ def write_snapshot_to_bigquery(metrics_df, table_id, schema=None, dry_run=False)
             logger.warning(f"Empty DataFrame - no data to write")
             return False
 
-        # Value range validation for numeric columns
-        for col in metrics_df.select_dtypes(include=['number']).columns:
-            max_val = metrics_df[col].max()
+        # Value range validation for numeric columns (one reduction over all of them)
+        column_maxes = metrics_df.select_dtypes(include=['number']).max()
+        for col, max_val in column_maxes.items():
             if pd.notna(max_val) and max_val > 1e9:  # Guard against NA/NaN
                 logger.warning(f"Suspicious high value in {col}: {max_val}")
 
@@ -65,60 +65,36 @@ def write_snapshot_to_bigquery(metrics_df, table_id, schema=None, dry_run=False)
 
         # Approach depends on whether the table exists
         if not table_exists:
-            # For first run, write the table directly using a CREATE TABLE AS SELECT statement
-            # This avoids the Arrow conversion issues
+            # For first run, load the CSV straight into the target table.
+            # The load job creates the table from the schema, so no temp
+            # table or CREATE TABLE AS SELECT is needed. CSV also avoids
+            # the Arrow conversion issues.
             logger.info("Creating new table from dataframe")
 
-            # Save to temporary CSV
-            temp_csv = f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            metrics_df.to_csv(temp_csv, index=False)
+            # Serialise to an in-memory CSV (no temp file on disk)
+            csv_buffer = io.BytesIO(metrics_df.to_csv(index=False).encode("utf-8"))
 
             try:
-                # Upload CSV to a temporary table
-                dataset_id = table_id.split('.')[1]
-                project_id = table_id.split('.')[0]
-                table_name = table_id.split('.')[2]
-                temp_table_id = f"{project_id}.{dataset_id}.temp_{table_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
                 # Define CSV loading job
                 job_config = bigquery.LoadJobConfig(
                     schema=schema,
                     skip_leading_rows=1,  # Skip header row
                     source_format=bigquery.SourceFormat.CSV,
+                    create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
+                    write_disposition=bigquery.WriteDisposition.WRITE_EMPTY,
                 )
 
-                # Load CSV to temp table
-                with open(temp_csv, "rb") as source_file:
-                    job = client.load_table_from_file(
-                        source_file, temp_table_id, job_config=job_config
-                    )
-                    job.result()  # Wait for the job to complete
-
-                logger.info(f"Loaded CSV to temporary table {temp_table_id}")
-
-                # Now create the target table from the temp table
-                create_table_query = f"""
-                CREATE OR REPLACE TABLE `{table_id}` AS
-                SELECT * FROM `{temp_table_id}`
-                """
-
-                create_job = client.query(create_table_query)
-                create_job.result()
-
-                # Delete the temp table
-                client.delete_table(temp_table_id)
-
-                # Delete temp CSV
-                if os.path.exists(temp_csv):
-                    os.remove(temp_csv)
+                # Load CSV to new table
+                job = client.load_table_from_file(
+                    csv_buffer, table_id, job_config=job_config
+                )
+                job.result()  # Wait for the job to complete
 
                 logger.info(f"Successfully created table {table_id} with {len(metrics_df)} records")
                 return True
 
             except Exception as e:
                 logger.error(f"Error creating table: {str(e)}", exc_info=True)
-                if os.path.exists(temp_csv):
-                    os.remove(temp_csv)
                 raise
         else:
             # Table exists, do backup and same-day cleanup
@@ -127,12 +103,18 @@ def write_snapshot_to_bigquery(metrics_df, table_id, schema=None, dry_run=False)
             backup_query = f"""
             CREATE OR REPLACE TABLE `{backup_table}` AS
             SELECT * FROM `{table_id}` 
-            WHERE snapshot_date = '{snapshot_date}'
+            WHERE snapshot_date = @snapshot_date
             """
+            # Backup and delete share the same snapshot_date parameter
+            snapshot_date_config = bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ScalarQueryParameter("snapshot_date", "DATE", snapshot_date)
+                ]
+            )
 
             # Execute backup
             try:
-                backup_job = client.query(backup_query)
+                backup_job = client.query(backup_query, job_config=snapshot_date_config)
                 backup_job.result()
                 logger.info(f"Backed up existing data for {snapshot_date} to {backup_table}")
             except Exception as e:
@@ -140,20 +122,18 @@ def write_snapshot_to_bigquery(metrics_df, table_id, schema=None, dry_run=False)
 
             # Delete existing records for this date
             delete_query = f"""
-            DELETE FROM `{table_id}` 
-            WHERE snapshot_date = '{snapshot_date}'
+            DELETE FROM `{table_id}`
+            WHERE snapshot_date = @snapshot_date
             """
-
             try:
-                delete_job = client.query(delete_query)
+                delete_job = client.query(delete_query, job_config=snapshot_date_config)
                 delete_job.result()
                 logger.info(f"Deleted existing data for {snapshot_date}")
             except Exception as e:
                 logger.warning(f"Delete operation failed: {str(e)}")
 
-            # Save to temporary CSV and load via BQ SQL
-            temp_csv = f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            metrics_df.to_csv(temp_csv, index=False)
+            # Serialise to an in-memory CSV (no temp file on disk)
+            csv_buffer = io.BytesIO(metrics_df.to_csv(index=False).encode("utf-8"))
 
             try:
                 # Define CSV loading job
@@ -165,23 +145,16 @@ def write_snapshot_to_bigquery(metrics_df, table_id, schema=None, dry_run=False)
                 )
 
                 # Load CSV to existing table
-                with open(temp_csv, "rb") as source_file:
-                    job = client.load_table_from_file(
-                        source_file, table_id, job_config=job_config
-                    )
-                    job.result()  # Wait for the job to complete
-
-                # Delete temp CSV
-                if os.path.exists(temp_csv):
-                    os.remove(temp_csv)
+                job = client.load_table_from_file(
+                    csv_buffer, table_id, job_config=job_config
+                )
+                job.result()  # Wait for the job to complete
 
                 logger.info(f"Successfully wrote {len(metrics_df)} records to {table_id}")
                 return True
 
             except Exception as e:
                 logger.error(f"Error appending to table: {str(e)}", exc_info=True)
-                if os.path.exists(temp_csv):
-                    os.remove(temp_csv)
                 raise
 
     except Exception as e:
@@ -14,28 +14,32 @@ WITH monthly_data AS (
   FROM `outstaffer-app-prod.dashboard_metrics.base_contracts_view`
   WHERE contract_start_date IS NOT NULL
   GROUP BY month_date, country
-)
+),
 
-SELECT
+windowed AS (
+  SELECT
     md.*,
     SUM(md.new_contracts) OVER (
-    PARTITION BY md.country
-    ORDER BY md.month_date
-    ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
-  ) AS cumulative_contracts,
+      PARTITION BY md.country
+      ORDER BY md.month_date
+      ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+    ) AS cumulative_contracts,
 
-  -- Growth metrics
-        LAG(md.new_contracts) OVER (
-    PARTITION BY md.country
-    ORDER BY md.month_date
-  ) AS prev_month_new_contracts,
+    -- Growth metrics (LAG evaluated once, reused for the growth rate below)
+    LAG(md.new_contracts) OVER (
+      PARTITION BY md.country
+      ORDER BY md.month_date
+    ) AS prev_month_new_contracts
+  FROM monthly_data md
+)
+
+SELECT
+  w.*,
 
   -- Calculate month-over-month growth rate
-        CASE
-            WHEN LAG(md.new_contracts) OVER (PARTITION BY md.country ORDER BY md.month_date) > 0
-    THEN (md.new_contracts - LAG(md.new_contracts) OVER (PARTITION BY md.country ORDER BY md.month_date))
-                / LAG(md.new_contracts) OVER (PARTITION BY md.country ORDER BY md.month_date) * 100
-            ELSE NULL
-            END AS mom_growth_rate
-FROM monthly_data md
-ORDER BY md.month_date DESC, md.country
\ No newline at end of file
+  CASE
+    WHEN w.prev_month_new_contracts > 0
+    THEN (w.new_contracts - w.prev_month_new_contracts) / w.prev_month_new_contracts * 100
+    ELSE NULL
+  END AS mom_growth_rate
+FROM windowed w
\ No newline at end of file